@@ -9,25 +9,118 @@ It handles command-line arguments and starts the game.
 """
 
 import sys
+import zlib
 import argparse
+from src.analytics.columnar import ColumnarExporter
+from src.analytics.log_analytics import analyze_logs, show_report
 from src.game.game_controller import GameController
+from src.utils.config import difficulties
+from src.utils.profiling import (
+    DeterministicProfiler, MemoryTracker, SamplingProfiler, install_signal_handlers
+)
 
 def main():
     """Main function to run the game."""
     parser = argparse.ArgumentParser(description='Number Guessing Game')
+    
+    # A broken difficulty file only matters when playing
+    try:
+        levels, default_level, config_error = difficulties.names(), difficulties.default(), None
+    except (OSError, ValueError) as error:
+        levels, default_level, config_error = (), None, error
+    
     parser.add_argument('-d', '--difficulty', 
-                        choices=['easy', 'medium', 'hard', 'custom'],
-                        default='medium', 
+                        choices=[*levels, 'custom'],
+                        default=default_level, 
                         help='Game difficulty level')
     parser.add_argument('-i', '--instructions', 
                         action='store_true',
                         help='Show game instructions')
+    parser.add_argument('--profile',
+                        metavar='FILE',
+                        help='Profile every call with cProfile and write pstats data to FILE')
+    parser.add_argument('--profile-sample',
+                        metavar='FILE',
+                        help='Sample the call stack and write folded stacks to FILE')
+    parser.add_argument('--sample-interval',
+                        type=float,
+                        default=0.01,
+                        metavar='SECONDS',
+                        help='Seconds between stack samples (default: 0.01)')
+    parser.add_argument('--trace-malloc',
+                        type=int,
+                        metavar='N',
+                        help='Log memory growth from tracemalloc every N games')
+    parser.add_argument('--analyze-logs',
+                        nargs='+',
+                        metavar='FILE',
+                        help='Show statistics from game log files (plain or .gz) instead of playing')
+    parser.add_argument('--workers',
+                        type=int,
+                        default=1,
+                        metavar='N',
+                        help='Number of processes used by --analyze-logs (default: 1)')
+    parser.add_argument('--export-dir',
+                        metavar='DIR',
+                        help='Write finished games to columnar files in DIR (requires numpy)')
+    parser.add_argument('--export-format',
+                        choices=['auto', 'npy', 'arrow'],
+                        default='auto',
+                        help='Columnar file format; auto uses Arrow when pyarrow is installed')
     
     args = parser.parse_args()
+    if args.trace_malloc is not None and args.trace_malloc < 1:
+        parser.error("--trace-malloc must be at least 1")
+    
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    
+    if config_error and not args.analyze_logs:
+        parser.error(f"cannot load difficulty levels: {config_error}")
     
-    # Create and run the game controller
-    game = GameController()
-    return game.run(args.difficulty, args.instructions)
+    exporter = None
+    if args.export_dir and not args.analyze_logs:
+        try:
+            exporter = ColumnarExporter(args.export_dir, file_format=args.export_format)
+        except ImportError as error:
+            parser.error(str(error))
+    
+    profilers = []
+    if args.profile:
+        profilers.append(DeterministicProfiler(args.profile))
+    if args.profile_sample:
+        profilers.append(SamplingProfiler(args.profile_sample, args.sample_interval))
+    if args.trace_malloc is not None:
+        profilers.append(MemoryTracker(args.trace_malloc))
+    
+    for profiler in profilers:
+        profiler.start()
+    if profilers:
+        install_signal_handlers(profilers)
+    
+    try:
+        if args.analyze_logs:
+            try:
+                stats = analyze_logs(args.analyze_logs, args.workers)
+            except (OSError, EOFError, zlib.error) as error:
+                parser.error(f"cannot read log files: {error}")
+            show_report(stats)
+            return 0
+        
+        # Create and run the game controller
+        game = GameController()
+        if exporter:
+            game.game_listeners.append(exporter.add)
+        for profiler in profilers:
+            game.game_listeners.append(profiler.game_finished)
+        return game.run(args.difficulty, args.instructions)
+    finally:
+        if exporter:
+            exporter.close()
+        for profiler in profilers:
+            profiler.report()
+            if profiler.running:
+                profiler.stop()
 
 if __name__ == "__main__":
     try:
@@ -13,6 +13,7 @@ import random
 import time
 import argparse
 import sys
+from src.utils.config import difficulties
 
 def get_difficulty_settings(difficulty):
     """
@@ -24,23 +25,18 @@ def get_difficulty_settings(difficulty):
     Returns:
         tuple: (min_number, max_number, max_attempts)
     """
-    if difficulty == 'easy':
-        return 1, 50, 10
-    elif difficulty == 'medium':
-        return 1, 100, 7
-    elif difficulty == 'hard':
-        return 1, 200, 5
-    elif difficulty == 'custom':
+    if difficulty == 'custom':
         try:
             min_num = int(input("Enter minimum number: "))
             max_num = int(input("Enter maximum number: "))
             attempts = int(input("Enter maximum number of attempts: "))
             return min_num, max_num, attempts
         except ValueError:
-            print("Invalid input. Using medium difficulty.")
-            return 1, 100, 7
+            default = difficulties.default()
+            print(f"Invalid input. Using {default} difficulty.")
+            return difficulties.get(default)
     else:
-        return 1, 100, 7  # Default to medium
+        return difficulties.get(difficulty)
 
 def play_game(min_number, max_number, max_attempts):
     """
@@ -129,21 +125,27 @@ def show_instructions():
     print("3. After each guess, you'll get feedback (too high/too low).")
     print("4. Type 'q', 'quit', or 'exit' at any time to end the game.")
     print("5. Different difficulty levels provide different challenges.")
-    print("   - Easy: 1-50, 10 attempts")
-    print("   - Medium: 1-100, 7 attempts")
-    print("   - Hard: 1-200, 5 attempts")
+    for name, level in difficulties.levels.items():
+        print(f"   - {name.capitalize()}: {level.min_number}-{level.max_number}, "
+              f"{level.max_attempts} attempts")
     print("   - Custom: You define the parameters")
     print("6. Have fun and good luck!\n")
 
 def main():
     """Main function to run the game."""
     parser = argparse.ArgumentParser(description='Number Guessing Game')
-    parser.add_argument('-d', '--difficulty', choices=['easy', 'medium', 'hard', 'custom'],
-                        default='medium', help='Game difficulty level')
+    try:
+        levels, default_level, config_error = difficulties.names(), difficulties.default(), None
+    except (OSError, ValueError) as error:
+        levels, default_level, config_error = (), None, error
+    parser.add_argument('-d', '--difficulty', choices=[*levels, 'custom'],
+                        default=default_level, help='Game difficulty level')
     parser.add_argument('-i', '--instructions', action='store_true',
                         help='Show game instructions')
     
     args = parser.parse_args()
+    if config_error:
+        parser.error(f"cannot load difficulty levels: {config_error}")
     
     print("\n===== NUMBER GUESSING GAME =====")
     
@@ -156,8 +158,16 @@ def main():
     
     # Game loop
     play_again = True
+    settings = None
     while play_again:
-        min_num, max_num, max_attempts = get_difficulty_settings(args.difficulty)
+        try:
+            settings = get_difficulty_settings(args.difficulty)
+        except ValueError:
+            # The level was removed from the difficulty file while playing
+            if settings is None:
+                raise
+            print("Difficulty level no longer available. Keeping previous settings.")
+        min_num, max_num, max_attempts = settings
         
         # Play one game
         if play_game(min_num, max_num, max_attempts):
@@ -0,0 +1,8 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Package initialization file for the analytics module.
+
+This file marks the analytics directory as a Python package.
+"""
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Columnar Export Module
+
+This module writes finished games to chunked columnar files and reads them
+back memory-mapped, so aggregations over many games run vectorized without
+loading everything into memory.
+
+Each chunk holds up to chunk_size games with one column per GameRecord
+field. The guess sequences are stored as two columns: guess_values holds
+all guesses of the chunk back to back, and game i's guesses are
+guess_values[guess_offsets[i]:guess_offsets[i + 1]].
+
+Chunks are written either as a directory of .npy files (needs numpy) or as
+an Arrow IPC file (needs pyarrow).
+"""
+
+import logging
+import os
+import re
+import shutil
+from src.game.game_controller import OUTCOME_QUIT, OUTCOME_WON
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+except ImportError:
+    pa = None
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+CHUNK_PATTERN = re.compile(r'^chunk-(\d{6})(\.arrow)?$')
+
+NUMBER_COLUMNS = ('min_number', 'max_number', 'secret_number')
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+class ColumnarExporter:
+    """Buffers finished games and writes them as columnar chunks."""
+    
+    def __init__(self, directory, chunk_size=100000, file_format='auto'):
+        """
+        Initialize the exporter.
+        
+        Args:
+            directory (str): Directory the chunks are written to
+            chunk_size (int): Number of games per chunk
+            file_format (str): 'npy', 'arrow', or 'auto' for Arrow when
+                pyarrow is installed and .npy otherwise
+        
+        Raises:
+            ImportError: If the library needed for the format is not installed
+        """
+        if file_format == 'auto':
+            file_format = 'arrow' if pa is not None else 'npy'
+        if file_format == 'arrow' and pa is None:
+            raise ImportError("pyarrow is required for Arrow export")
+        if np is None:
+            raise ImportError("numpy is required for columnar export")
+        
+        self.directory = directory
+        self.chunk_size = chunk_size
+        self.file_format = file_format
+        self._records = []
+        os.makedirs(directory, exist_ok=True)
+        self._next_chunk = 1 + max((int(found.group(1)) for found in
+                                    map(CHUNK_PATTERN.match, os.listdir(directory)) if found),
+                                   default=-1)
+        logger.info(f"Columnar exporter writing {file_format} chunks to {directory}")
+    
+    def add(self, record):
+        """
+        Add a finished game, writing a chunk when enough games are buffered.
+        
+        Games with numbers that don't fit in 64 bits are skipped.
+        
+        Args:
+            record (GameRecord): The finished game
+        """
+        numbers = (record.min_number, record.max_number, record.secret_number, *record.guesses)
+        if not all(INT64_MIN <= number <= INT64_MAX for number in numbers):
+            logger.warning("Game with numbers beyond 64 bits not exported")
+            return
+        self._records.append(record)
+        if len(self._records) >= self.chunk_size:
+            self.flush()
+    
+    def flush(self):
+        """Write the buffered games as a new chunk."""
+        if not self._records:
+            return
+        columns = self._build_columns(self._records)
+        name = f"chunk-{self._next_chunk:06d}"
+        if self.file_format == 'arrow':
+            self._write_arrow(name, columns)
+        else:
+            self._write_npy(name, columns)
+        logger.info(f"Exported {len(self._records)} games to {name}")
+        self._next_chunk += 1
+        self._records = []
+    
+    def close(self):
+        """Write any buffered games."""
+        self.flush()
+    
+    def _build_columns(self, records):
+        """Convert records to a mapping of column names to numpy arrays."""
+        columns = {
+            'difficulty': np.array([record.difficulty for record in records], dtype=str),
+            'attempts': np.array([record.attempts for record in records], dtype=np.int32),
+            'outcome': np.array([record.outcome for record in records], dtype=np.int8),
+        }
+        for name in NUMBER_COLUMNS:
+            columns[name] = np.array([getattr(record, name) for record in records], dtype=np.int64)
+        lengths = np.array([len(record.guesses) for record in records], dtype=np.int64)
+        columns['guess_offsets'] = np.concatenate(([0], np.cumsum(lengths)))
+        columns['guess_values'] = np.fromiter(
+            (guess for record in records for guess in record.guesses),
+            dtype=np.int64, count=int(columns['guess_offsets'][-1]))
+        return columns
+    
+    def _write_npy(self, name, columns):
+        """Write a chunk as a directory of .npy files."""
+        # Write to a temporary directory so readers never see a partial chunk
+        partial = os.path.join(self.directory, f".{name}.partial")
+        os.makedirs(partial, exist_ok=True)
+        try:
+            for column, values in columns.items():
+                np.save(os.path.join(partial, f"{column}.npy"), values)
+            os.rename(partial, os.path.join(self.directory, name))
+        except OSError:
+            shutil.rmtree(partial, ignore_errors=True)
+            raise
+    
+    def _write_arrow(self, name, columns):
+        """Write a chunk as an Arrow IPC file with a list column for the guesses."""
+        arrays = {column: pa.array(values) for column, values in columns.items()
+                  if not column.startswith('guess_')}
+        arrays['guesses'] = pa.LargeListArray.from_arrays(
+            pa.array(columns['guess_offsets']), pa.array(columns['guess_values']))
+        table = pa.table(arrays)
+        
+        # Write to a temporary file so readers never see a partial chunk
+        partial = os.path.join(self.directory, f".{name}.partial")
+        try:
+            with pa.OSFile(partial, 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table, max_chunksize=len(table))
+            os.rename(partial, os.path.join(self.directory, f"{name}.arrow"))
+        except OSError:
+            if os.path.exists(partial):
+                os.remove(partial)
+            raise
+
+class ColumnarReader:
+    """Reads exported chunks memory-mapped."""
+    
+    def __init__(self, directory):
+        """
+        Initialize the reader.
+        
+        Args:
+            directory (str): Directory containing the chunks
+        
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        if np is None:
+            raise ImportError("numpy is required to read columnar exports")
+        self.directory = directory
+    
+    def chunk_paths(self):
+        """
+        Get the chunk paths in the order they were written.
+        
+        Returns:
+            list: Paths to chunk directories and Arrow files
+        """
+        names = sorted(name for name in os.listdir(self.directory) if CHUNK_PATTERN.match(name))
+        return [os.path.join(self.directory, name) for name in names]
+    
+    def chunks(self):
+        """
+        Yield the columns of each chunk.
+        
+        Yields:
+            dict: Column names mapped to memory-mapped numpy arrays
+        """
+        for path in self.chunk_paths():
+            if path.endswith('.arrow'):
+                yield self._read_arrow(path)
+            else:
+                yield {name[:-len('.npy')]: np.load(os.path.join(path, name), mmap_mode='r')
+                       for name in os.listdir(path) if name.endswith('.npy')}
+    
+    def column(self, name):
+        """
+        Yield one column chunk by chunk.
+        
+        Args:
+            name (str): Column name
+        
+        Yields:
+            numpy.ndarray: The column's values in a chunk
+        """
+        for chunk in self.chunks():
+            yield chunk[name]
+    
+    def summary(self):
+        """
+        Aggregate all games.
+        
+        Returns:
+            dict: games, wins, quits, win_rate, average_attempts and attempts
+                (games won per number of attempts)
+        """
+        games = wins = quits = total_attempts = 0
+        won_attempts = np.zeros(0, dtype=np.int64)
+        for chunk in self.chunks():
+            outcome = chunk['outcome']
+            won = outcome == OUTCOME_WON
+            attempts = chunk['attempts']
+            games += len(outcome)
+            wins += int(np.count_nonzero(won))
+            quits += int(np.count_nonzero(outcome == OUTCOME_QUIT))
+            total_attempts += int(attempts.sum(dtype=np.int64))
+            counts = np.bincount(attempts[won])
+            if len(counts) > len(won_attempts):
+                won_attempts = np.pad(won_attempts, (0, len(counts) - len(won_attempts)))
+            won_attempts[:len(counts)] += counts
+        return {
+            'games': games,
+            'wins': wins,
+            'quits': quits,
+            'win_rate': wins / games * 100 if games else 0.0,
+            'average_attempts': total_attempts / games if games else 0.0,
+            'attempts': {attempts: int(count) for attempts, count in enumerate(won_attempts) if count},
+        }
+    
+    def _read_arrow(self, path):
+        """Read an Arrow chunk without copying its numeric columns."""
+        if pa is None:
+            raise ImportError(f"pyarrow is required to read {path}")
+        table = pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+        columns = {}
+        for name in table.column_names:
+            chunked = table.column(name)
+            array = chunked.chunk(0) if chunked.num_chunks == 1 else chunked.combine_chunks()
+            if name == 'guesses':
+                columns['guess_offsets'] = array.offsets.to_numpy()
+                columns['guess_values'] = array.values.to_numpy()
+            else:
+                # Strings can't be viewed without a copy
+                columns[name] = array.to_numpy(zero_copy_only=False)
+        return columns
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Log Analytics Module
+
+This module reconstructs games from the game's log output and computes
+statistics over them. Logs are streamed line by line, so memory use does not
+depend on the size of the logs. Plain and gzip-compressed files are read,
+and rotated files (game.log.2.gz, game.log.1, game.log) are read oldest
+first so games spanning a rotation are kept together.
+
+All games in one file are assumed to come from a single process.
+"""
+
+import collections
+import datetime
+import gzip
+import logging
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Log lines written with the format configured in game_controller, restricted
+# to the messages that describe a game
+EVENT_PATTERN = re.compile(
+    r'(?P<time>\d{4}-\d\d-\d\d \d\d:\d\d:\d\d),(?P<msec>\d{3}) - \S+ - \w+ - '
+    r'(?:(?P<start>New game initialized with range )'
+    r'|(?P<guess>Player guessed )'
+    r'|(?P<invalid>Invalid input received$)'
+    r'|(?P<ignored>(?:Repeated|Excluded) guess )'
+    r'|(?P<won>Player won in (?P<attempts>\d+) attempts$)'
+    r'|(?P<quit>Player chose to quit$)'
+    r'|(?P<lost>Player lost\.))'
+)
+
+ROTATED_PATTERN = re.compile(r'^(?P<base>.*?)(?:\.(?P<number>\d+))?(?:\.gz)?$')
+
+class LogStats:
+    """Statistics accumulated over the games found in a log."""
+    
+    def __init__(self):
+        """Initialize empty statistics."""
+        self.games = 0
+        self.wins = 0
+        self.losses = 0
+        self.quits = 0
+        self.incomplete = 0
+        self.guesses = 0
+        self.invalid_inputs = 0
+        self.ignored_guesses = 0
+        self.guess_time = 0.0
+        self.timed_guesses = 0
+        self.attempts = collections.Counter()
+        # State of the game currently being read
+        self._in_game = False
+        self._last_time = None
+        self._previous_time = None
+    
+    def add_event(self, kind, timestamp, attempts=None):
+        """
+        Update the statistics with one log event.
+        
+        Args:
+            kind (str): Event name, one of the groups of EVENT_PATTERN
+            timestamp (float): Event time in seconds
+            attempts (int): Number of attempts, for 'won' events
+        """
+        if kind == 'start':
+            if self._in_game:
+                self.incomplete += 1
+            self.games += 1
+            self._in_game = True
+            self._last_time = timestamp
+        elif not self._in_game:
+            return
+        elif kind == 'guess':
+            self.guesses += 1
+            self.guess_time += timestamp - self._last_time
+            self.timed_guesses += 1
+            self._previous_time = self._last_time
+            self._last_time = timestamp
+        elif kind == 'invalid':
+            self.invalid_inputs += 1
+        elif kind == 'ignored':
+            # The guess was logged just before, but didn't use an attempt, so
+            # its time counts towards the next guess instead
+            self.guesses -= 1
+            self.ignored_guesses += 1
+            self.guess_time -= self._last_time - self._previous_time
+            self.timed_guesses -= 1
+            self._last_time = self._previous_time
+        elif kind == 'won':
+            self.wins += 1
+            self.attempts[attempts] += 1
+            self._in_game = False
+        elif kind == 'quit':
+            self.quits += 1
+        elif kind == 'lost':
+            self.losses += 1
+            self._in_game = False
+    
+    def finish(self):
+        """Count a game left unfinished at the end of the log."""
+        if self._in_game:
+            self.incomplete += 1
+            self._in_game = False
+    
+    def merge(self, other):
+        """
+        Add the statistics of another log.
+        
+        Args:
+            other (LogStats): Finished statistics to add
+        """
+        for name in ('games', 'wins', 'losses', 'quits', 'incomplete', 'guesses',
+                     'invalid_inputs', 'ignored_guesses', 'guess_time', 'timed_guesses'):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        self.attempts.update(other.attempts)
+    
+    @property
+    def win_rate(self):
+        """Percentage of finished games that were won."""
+        finished = self.wins + self.losses
+        return self.wins / finished * 100 if finished else 0.0
+    
+    @property
+    def invalid_input_rate(self):
+        """Percentage of inputs that were not valid numbers."""
+        inputs = self.guesses + self.ignored_guesses + self.invalid_inputs
+        return self.invalid_inputs / inputs * 100 if inputs else 0.0
+    
+    @property
+    def average_guess_time(self):
+        """Average seconds between the start of a game or previous counted guess and a guess."""
+        return self.guess_time / self.timed_guesses if self.timed_guesses else 0.0
+
+def open_log(path):
+    """
+    Open a log file for reading, decompressing it if needed.
+    
+    Args:
+        path (str): Path to a plain or .gz log file
+    
+    Returns:
+        file: Text file object
+    """
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8', errors='replace')
+    return open(path, encoding='utf-8', errors='replace')
+
+def read_lines(paths):
+    """
+    Yield the lines of several log files in order.
+    
+    Args:
+        paths (list): Paths to log files
+    
+    Yields:
+        str: Log lines
+    """
+    for path in paths:
+        with open_log(path) as log_file:
+            yield from log_file
+
+def parse_events(lines):
+    """
+    Yield the game events found in log lines.
+    
+    Args:
+        lines (iterable): Log lines
+    
+    Yields:
+        tuple: (kind, timestamp, attempts)
+    """
+    epoch_seconds = {}
+    match = EVENT_PATTERN.match
+    for line in lines:
+        found = match(line)
+        if found is None:
+            continue
+        # Many lines share the same second, so only parse each second once
+        second = found['time']
+        seconds = epoch_seconds.get(second)
+        if seconds is None:
+            if len(epoch_seconds) > 1024:
+                epoch_seconds.clear()
+            seconds = datetime.datetime.fromisoformat(second).timestamp()
+            epoch_seconds[second] = seconds
+        timestamp = seconds + int(found['msec']) / 1000
+        kind = found.lastgroup
+        if kind == 'won':
+            yield kind, timestamp, int(found['attempts'])
+        else:
+            yield kind, timestamp, None
+
+def analyze_files(paths):
+    """
+    Compute statistics for log files read one after another.
+    
+    Args:
+        paths (list): Paths to log files, oldest first
+    
+    Returns:
+        LogStats: Statistics for the games in the files
+    """
+    stats = LogStats()
+    for kind, timestamp, attempts in parse_events(read_lines(paths)):
+        stats.add_event(kind, timestamp, attempts)
+    stats.finish()
+    return stats
+
+def group_rotated(paths):
+    """
+    Group rotated log files by their base name, oldest file first.
+    
+    Args:
+        paths (list): Paths to log files
+    
+    Returns:
+        list: Lists of paths, one per base name
+    """
+    groups = collections.defaultdict(list)
+    for path in paths:
+        found = ROTATED_PATTERN.match(path)
+        number = int(found['number']) if found['number'] else 0
+        groups[found['base']].append((number, path))
+    return [[path for number, path in sorted(group, reverse=True)]
+            for group in groups.values()]
+
+def analyze_logs(paths, workers=1):
+    """
+    Compute statistics over log files.
+    
+    Args:
+        paths (list): Paths to log files, including rotated and .gz files
+        workers (int): Number of processes; each group of rotated files is
+            analyzed by one process
+    
+    Returns:
+        LogStats: Statistics for all games in the files
+    
+    Raises:
+        OSError: If a file can't be read or isn't valid gzip
+        EOFError: If a .gz file is truncated
+    """
+    groups = group_rotated(paths)
+    stats = LogStats()
+    if workers > 1 and len(groups) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for group_stats in executor.map(analyze_files, groups):
+                stats.merge(group_stats)
+    else:
+        for group in groups:
+            stats.merge(analyze_files(group))
+    logger.info(f"Analyzed {stats.games} games from {len(paths)} log files")
+    return stats
+
+def show_report(stats):
+    """
+    Display the statistics.
+    
+    Args:
+        stats (LogStats): Statistics to display
+    """
+    print("\n=== Log Analytics ===")
+    print(f"Games: {stats.games}")
+    print(f"Wins: {stats.wins}")
+    print(f"Losses: {stats.losses} ({stats.quits} quit)")
+    print(f"Unfinished: {stats.incomplete}")
+    print(f"Win Rate: {stats.win_rate:.1f}%")
+    print(f"Guesses: {stats.guesses}")
+    print(f"Invalid Input Rate: {stats.invalid_input_rate:.1f}%")
+    print(f"Ignored Guesses: {stats.ignored_guesses}")
+    print(f"Average Time per Guess: {stats.average_guess_time:.2f}s")
+    if stats.attempts:
+        print("Attempts to Win:")
+        for attempts, count in sorted(stats.attempts.items()):
+            print(f"  {attempts}: {count}")
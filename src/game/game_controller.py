@@ -8,9 +8,11 @@ This module contains the GameController class which manages the game flow.
 """
 
 import logging
+from collections import namedtuple
 from src.game.game_logic import GameLogic
+from src.game.guess_history import GuessHistory
 from src.game.game_ui import GameUI
-from src.utils.config import DifficultySettings
+from src.utils.config import DifficultySettings, difficulties
 
 # Set up logging
 logging.basicConfig(
@@ -19,28 +21,52 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Outcomes of a finished game
+OUTCOME_WON = 0
+OUTCOME_OUT_OF_ATTEMPTS = 1
+OUTCOME_QUIT = 2
+
+GameRecord = namedtuple('GameRecord', [
+    'difficulty', 'min_number', 'max_number', 'secret_number', 'attempts', 'outcome', 'guesses'
+])
+
 class GameController:
     """Controls the flow of the game."""
     
-    def __init__(self):
-        """Initialize the game controller."""
+    def __init__(self, warn_redundant_guesses=True):
+        """
+        Initialize the game controller.
+        
+        Args:
+            warn_redundant_guesses (bool): Whether repeated guesses and guesses
+                already ruled out by feedback are rejected with a warning
+                instead of consuming an attempt
+        """
         self.ui = GameUI()
         self.game_logic = GameLogic()
+        self.warn_redundant_guesses = warn_redundant_guesses
+        # Callables notified with a GameRecord for every finished game
+        self.game_listeners = []
         self.wins = 0
         self.losses = 0
         logger.info("Game controller initialized")
     
-    def run(self, difficulty='medium', show_instructions=False):
+    def run(self, difficulty=None, show_instructions=False):
         """
         Run the game.
         
         Args:
-            difficulty (str): Difficulty level ('easy', 'medium', 'hard', 'custom')
+            difficulty (str): Difficulty level ('easy', 'medium', 'hard', 'custom'),
+                or None for the default level
             show_instructions (bool): Whether to show instructions
             
         Returns:
             int: Exit code (0 for success)
         """
+        if difficulty is None:
+            difficulty = difficulties.default()
+        settings = None
+        
         self.ui.show_welcome()
         
         if show_instructions:
@@ -53,10 +79,17 @@ class GameController:
             if difficulty == 'custom':
                 min_num, max_num, max_attempts = self.ui.get_custom_settings()
             else:
-                min_num, max_num, max_attempts = DifficultySettings.get_settings(difficulty)
+                try:
+                    settings = DifficultySettings.get_settings(difficulty)
+                except ValueError:
+                    # The level was removed from the difficulty file while playing
+                    if settings is None:
+                        raise
+                    logger.warning(f"Difficulty {difficulty!r} no longer defined, keeping previous settings")
+                min_num, max_num, max_attempts = settings
             
             # Play one game
-            result = self.play_game(min_num, max_num, max_attempts)
+            result = self.play_game(min_num, max_num, max_attempts, difficulty)
             if result:
                 self.wins += 1
                 logger.info(f"Player won. Total wins: {self.wins}")
@@ -73,14 +106,15 @@ class GameController:
         self.ui.show_goodbye()
         return 0
     
-    def play_game(self, min_num, max_num, max_attempts):
+    def play_game(self, min_num, max_num, max_attempts, difficulty='custom'):
         """
-        Play one game.
+        Play one game and notify the game listeners with its GameRecord.
         
         Args:
             min_num (int): Minimum number in range
             max_num (int): Maximum number in range
             max_attempts (int): Maximum number of attempts allowed
+            difficulty (str): Difficulty level the settings came from
             
         Returns:
             bool: True if player won, False otherwise
@@ -89,7 +123,8 @@ class GameController:
         self.game_logic.initialize_game(min_num, max_num)
         secret_number = self.game_logic.secret_number
         attempts = 0
-        guessed_numbers = []
+        history = GuessHistory(min_num, max_num)
+        outcome = OUTCOME_OUT_OF_ATTEMPTS
         
         logger.info(f"Game initialized with secret number: {secret_number}")
         self.ui.show_game_start(min_num, max_num, max_attempts)
@@ -100,22 +135,40 @@ class GameController:
             
             # Check if player wants to quit
             if quit_game:
-                self.ui.show_game_over(secret_number, guessed_numbers, False)
-                return False
+                self.ui.show_game_over(secret_number, history.guesses, False)
+                outcome = OUTCOME_QUIT
+                break
+            
+            # Warn about guesses that cannot be right without using an attempt
+            if self.warn_redundant_guesses:
+                if history.is_guessed(guess):
+                    self.ui.show_repeated_guess(guess)
+                    continue
+                if history.is_excluded(guess):
+                    self.ui.show_excluded_guess(guess, history.low, history.high)
+                    continue
                 
             # Track this attempt
             attempts += 1
-            guessed_numbers.append(guess)
+            result = self.game_logic.check_guess(guess)
+            history.record(guess, result)
             
             # Check if guess is correct
-            if guess == secret_number:
+            if result == 0:
                 self.ui.show_win(secret_number, attempts)
-                return True
+                outcome = OUTCOME_WON
+                break
             
             # Provide feedback
-            is_low = guess < secret_number
+            is_low = result < 0
             self.ui.show_feedback(is_low, max_attempts - attempts)
+        else:
+            # Player ran out of attempts
+            self.ui.show_game_over(secret_number, history.guesses, True)
         
-        # Player ran out of attempts
-        self.ui.show_game_over(secret_number, guessed_numbers, True)
-        return False
+        if self.game_listeners:
+            record = GameRecord(difficulty, min_num, max_num, secret_number, attempts,
+                                outcome, tuple(history.guesses))
+            for listener in self.game_listeners:
+                listener(record)
+        return outcome == OUTCOME_WON
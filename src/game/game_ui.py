@@ -8,10 +8,14 @@ This module contains the GameUI class which handles user interaction.
 """
 
 import logging
+from src.utils.config import difficulties
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Maximum number of guesses listed on the game over screen
+MAX_GUESSES_SHOWN = 20
+
 class GameUI:
     """Handles user interaction for the game."""
     
@@ -28,9 +32,9 @@ class GameUI:
         print("3. After each guess, you'll get feedback (too high/too low).")
         print("4. Type 'q', 'quit', or 'exit' at any time to end the game.")
         print("5. Different difficulty levels provide different challenges.")
-        print("   - Easy: 1-50, 10 attempts")
-        print("   - Medium: 1-100, 7 attempts")
-        print("   - Hard: 1-200, 5 attempts")
+        for name, level in difficulties.levels.items():
+            print(f"   - {name.capitalize()}: {level.min_number}-{level.max_number}, "
+                  f"{level.max_attempts} attempts")
         print("   - Custom: You define the parameters")
         print("6. Have fun and good luck!\n")
         logger.info("Instructions displayed")
@@ -103,6 +107,28 @@ class GameUI:
         
         logger.info(f"Feedback provided: {'Too low' if is_low else 'Too high'}")
     
+    def show_repeated_guess(self, guess):
+        """
+        Display a warning for a number that was already guessed.
+        
+        Args:
+            guess (int): The repeated guess
+        """
+        print(f"You already guessed {guess}. That attempt doesn't count.")
+        logger.info(f"Repeated guess {guess} ignored")
+    
+    def show_excluded_guess(self, guess, low, high):
+        """
+        Display a warning for a number already ruled out by earlier feedback.
+        
+        Args:
+            guess (int): The excluded guess
+            low (int): Lowest number still possible
+            high (int): Highest number still possible
+        """
+        print(f"{guess} was already ruled out. The number is between {low} and {high}.")
+        logger.info(f"Excluded guess {guess} ignored")
+    
     def show_win(self, secret_number, attempts):
         """
         Display win message.
@@ -129,7 +155,11 @@ class GameUI:
             print(f"\nThe number was {secret_number}. Better luck next time!")
             
         print(f"The number was {secret_number}.")
-        print(f"Your guesses: {guessed_numbers}")
+        if len(guessed_numbers) > MAX_GUESSES_SHOWN:
+            shown = guessed_numbers[-MAX_GUESSES_SHOWN:]
+            print(f"Your last {MAX_GUESSES_SHOWN} of {len(guessed_numbers)} guesses: {shown}")
+        else:
+            print(f"Your guesses: {guessed_numbers}")
         logger.info("Game over message displayed")
     
     def show_stats(self, wins, losses):
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Guess History Module
+
+This module contains the GuessHistory class which tracks the guesses made
+during a single game and the interval still consistent with the feedback.
+"""
+
+import logging
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+class GuessHistory:
+    """Tracks guesses and the feasible interval for one game."""
+    
+    def __init__(self, min_number, max_number):
+        """
+        Initialize the history for a new game.
+        
+        Args:
+            min_number (int): Minimum number in range
+            max_number (int): Maximum number in range
+        """
+        self.min_number = min_number
+        self.max_number = max_number
+        self.low = min_number
+        self.high = max_number
+        self.guesses = []
+        # Bounded by the number of attempts, whatever the size of the range
+        self._seen = set()
+        logger.debug(f"Guess history created for range {min_number}-{max_number}")
+    
+    def is_guessed(self, guess):
+        """
+        Check if the number has already been guessed.
+        
+        Args:
+            guess (int): The player's guess
+        
+        Returns:
+            bool: True if the number was guessed before, False otherwise
+        """
+        return guess in self._seen
+    
+    def is_excluded(self, guess):
+        """
+        Check if earlier feedback has already ruled the number out.
+        
+        Args:
+            guess (int): The player's guess
+        
+        Returns:
+            bool: True if the number is outside the feasible interval
+        """
+        return not self.low <= guess <= self.high
+    
+    def record(self, guess, result):
+        """
+        Record a guess and narrow the feasible interval.
+        
+        Args:
+            guess (int): The player's guess
+            result (int): 0 if correct, -1 if too low, 1 if too high
+        """
+        self.guesses.append(guess)
+        self._seen.add(guess)
+        
+        if result < 0:
+            self.low = max(self.low, guess + 1)
+        elif result > 0:
+            self.high = min(self.high, guess - 1)
+        else:
+            self.low = self.high = guess
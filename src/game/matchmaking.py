@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Matchmaking Module
+
+This module contains the MatchmakingQueue class which pairs players of
+similar skill for head-to-head games (both players get the same secret
+number and the one who needs fewer attempts wins).
+"""
+
+import bisect
+import itertools
+import logging
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATING = 1500.0
+K_FACTOR = 32.0
+
+def expected_score(rating, opponent_rating):
+    """
+    Calculate the expected Elo score against an opponent.
+    
+    Args:
+        rating (float): Player's rating
+        opponent_rating (float): Opponent's rating
+    
+    Returns:
+        float: Expected score between 0 and 1
+    """
+    return 1.0 / (1.0 + 10.0 ** ((opponent_rating - rating) / 400.0))
+
+def rating_from_results(results, rating=DEFAULT_RATING, k_factor=K_FACTOR):
+    """
+    Derive a rating from a history of single-player games.
+    
+    Each result of GameController.play_game is scored as a game against
+    an opponent rated DEFAULT_RATING: a win scores 1 and a loss scores 0.
+    
+    Args:
+        results (iterable): Booleans returned by play_game, oldest first
+        rating (float): Starting rating
+        k_factor (float): Elo K-factor
+    
+    Returns:
+        float: The derived rating
+    """
+    for won in results:
+        rating += k_factor * ((1.0 if won else 0.0) - expected_score(rating, DEFAULT_RATING))
+    return rating
+
+class MatchmakingQueue:
+    """Pairs queued players by rating and applies rating updates in batches."""
+    
+    def __init__(self, base_window=50.0, window_growth=25.0, max_window=400.0,
+                 k_factor=K_FACTOR):
+        """
+        Initialize the matchmaking queue.
+        
+        Args:
+            base_window (float): Largest rating gap accepted right after queueing
+            window_growth (float): Increase of the accepted gap per second waited
+            max_window (float): Upper limit for the accepted gap
+            k_factor (float): Elo K-factor used for match results
+        """
+        self.base_window = base_window
+        self.window_growth = window_growth
+        self.max_window = max_window
+        self.k_factor = k_factor
+        self.ratings = {}
+        # Sorted list of (rating, sequence, player_id, enqueued_at) entries
+        self._index = []
+        # Entries queued since the index was last sorted
+        self._arrivals = []
+        self._queued = {}
+        self._pending = []
+        self._sequence = itertools.count()
+        logger.info("Matchmaking queue initialized")
+    
+    def __len__(self):
+        """Return the number of queued players."""
+        return len(self._queued)
+    
+    def __contains__(self, player_id):
+        """Check if a player is queued."""
+        return player_id in self._queued
+    
+    def get_rating(self, player_id):
+        """
+        Get a player's current rating.
+        
+        Args:
+            player_id: Player identifier
+        
+        Returns:
+            float: The player's rating (DEFAULT_RATING if unknown)
+        """
+        return self.ratings.get(player_id, DEFAULT_RATING)
+    
+    def window(self, waited):
+        """
+        Get the accepted rating gap for a player who has waited a while.
+        
+        Args:
+            waited (float): Seconds spent in the queue
+        
+        Returns:
+            float: The accepted rating gap
+        """
+        return min(self.max_window, self.base_window + self.window_growth * waited)
+    
+    def enqueue(self, player_id, now, rating=None):
+        """
+        Add a player to the queue.
+        
+        Args:
+            player_id: Player identifier
+            now (float): Current time in seconds
+            rating (float): Rating to set for the player, e.g. one derived
+                with rating_from_results (keeps the known rating if None)
+        """
+        if player_id in self._queued:
+            raise ValueError(f"Player {player_id!r} is already queued")
+        if rating is not None:
+            self.ratings[player_id] = rating
+        self._insert(player_id, now)
+        logger.debug(f"Player {player_id!r} queued")
+    
+    def dequeue(self, player_id):
+        """
+        Remove a player from the queue.
+        
+        Args:
+            player_id: Player identifier
+        
+        Returns:
+            bool: True if the player was queued, False otherwise
+        """
+        entry = self._queued.pop(player_id, None)
+        if entry is None:
+            return False
+        self._merge_arrivals()
+        del self._index[bisect.bisect_left(self._index, entry)]
+        return True
+    
+    def find_opponent(self, player_id, now):
+        """
+        Find the queued player with the nearest rating within the window.
+        
+        Args:
+            player_id: Player identifier of a queued player
+            now (float): Current time in seconds
+        
+        Returns:
+            The opponent's player identifier, or None if nobody is close enough
+        """
+        self._merge_arrivals()
+        entry = self._queued[player_id]
+        rating = entry[0]
+        position = bisect.bisect_left(self._index, entry)
+        best = None
+        for neighbour in (position - 1, position + 1):
+            if 0 <= neighbour < len(self._index):
+                other = self._index[neighbour]
+                gap = abs(other[0] - rating)
+                waited = now - min(entry[3], other[3])
+                if gap <= self.window(waited) and (best is None or gap < best[0]):
+                    best = (gap, other[2])
+        return None if best is None else best[1]
+    
+    def report_result(self, player_a, player_b, score_a):
+        """
+        Record a head-to-head result to be applied on the next tick.
+        
+        Args:
+            player_a: First player's identifier
+            player_b: Second player's identifier
+            score_a (float): 1 if player_a won, 0 if player_b won, 0.5 for a draw
+        """
+        self._pending.append((player_a, player_b, score_a))
+    
+    def tick(self, now):
+        """
+        Apply pending rating updates and pair queued players.
+        
+        All results reported since the last tick are scored against the
+        ratings at the start of the tick, then applied together. Players are
+        paired greedily with their neighbour in rating order whenever the
+        gap is within the window of the longer-waiting player.
+        
+        Args:
+            now (float): Current time in seconds
+        
+        Returns:
+            list: (player_a, player_b) pairs removed from the queue
+        """
+        self._apply_pending()
+        self._merge_arrivals()
+        
+        pairs = []
+        remaining = []
+        index = self._index
+        i = 0
+        while i < len(index):
+            entry = index[i]
+            if i + 1 < len(index):
+                other = index[i + 1]
+                waited = now - min(entry[3], other[3])
+                if other[0] - entry[0] <= self.window(waited):
+                    pairs.append((entry[2], other[2]))
+                    del self._queued[entry[2]]
+                    del self._queued[other[2]]
+                    i += 2
+                    continue
+            remaining.append(entry)
+            i += 1
+        self._index = remaining
+        
+        if pairs:
+            logger.info(f"Matched {len(pairs)} pairs, {len(remaining)} players waiting")
+        return pairs
+    
+    def _insert(self, player_id, enqueued_at):
+        """Add a player to the arrivals waiting to be merged into the index."""
+        entry = (self.get_rating(player_id), next(self._sequence), player_id, enqueued_at)
+        self._arrivals.append(entry)
+        self._queued[player_id] = entry
+    
+    def _merge_arrivals(self):
+        """Merge new arrivals into the sorted index in one pass."""
+        if self._arrivals:
+            self._index.extend(self._arrivals)
+            self._index.sort()
+            self._arrivals = []
+    
+    def _apply_pending(self):
+        """Apply all pending results as one batch of Elo updates."""
+        if not self._pending:
+            return
+        deltas = {}
+        for player_a, player_b, score_a in self._pending:
+            change = self.k_factor * (score_a - expected_score(
+                self.get_rating(player_a), self.get_rating(player_b)))
+            deltas[player_a] = deltas.get(player_a, 0.0) + change
+            deltas[player_b] = deltas.get(player_b, 0.0) - change
+        self._pending = []
+        
+        requeued = []
+        for player_id, change in deltas.items():
+            self.ratings[player_id] = self.get_rating(player_id) + change
+            entry = self._queued.get(player_id)
+            if entry is not None:
+                requeued.append(entry)
+        
+        # Rebuild the index once with the affected entries at their new ratings
+        if requeued:
+            affected = {entry[2] for entry in requeued}
+            self._index = [entry for entry in self._index if entry[2] not in affected]
+            self._arrivals = [entry for entry in self._arrivals if entry[2] not in affected]
+            for entry in requeued:
+                self._insert(entry[2], entry[3])
+            self._merge_arrivals()
+        logger.info(f"Applied rating updates for {len(deltas)} players")
@@ -7,6 +7,146 @@ Configuration Module
 This module contains configuration settings for the game.
 """
 
+import json
+import logging
+import os
+import time
+from collections import namedtuple
+from types import MappingProxyType
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+DIFFICULTY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'difficulties.json')
+DEFAULT_DIFFICULTY = 'medium'
+
+Difficulty = namedtuple('Difficulty', ['min_number', 'max_number', 'max_attempts'])
+
+class DifficultyRegistry:
+    """Difficulty levels loaded from a JSON file and reloaded when it changes."""
+    
+    def __init__(self, path=DIFFICULTY_FILE, check_interval=1.0):
+        """
+        Initialize the registry. The file is read on first use.
+        
+        Args:
+            path (str): JSON file mapping level names to their min_number,
+                max_number and max_attempts
+            check_interval (float): Minimum seconds between checks of the
+                file's modification time
+        """
+        self.path = path
+        self.check_interval = check_interval
+        self._mtime = None
+        self._checked_at = None
+        self._levels = None
+    
+    def get(self, name):
+        """
+        Get the settings for a difficulty level.
+        
+        Args:
+            name (str): Difficulty level name
+        
+        Returns:
+            Difficulty: (min_number, max_number, max_attempts)
+        
+        Raises:
+            ValueError: If the difficulty level is unknown
+        """
+        try:
+            return self.levels[name]
+        except KeyError:
+            raise ValueError(f"Unknown difficulty level: {name!r}") from None
+    
+    def default(self):
+        """
+        Get the name of the default difficulty level.
+        
+        Returns:
+            str: DEFAULT_DIFFICULTY if defined, otherwise the first level in the file
+        """
+        levels = self.levels
+        return DEFAULT_DIFFICULTY if DEFAULT_DIFFICULTY in levels else next(iter(levels))
+    
+    def names(self):
+        """
+        Get the difficulty level names in file order.
+        
+        Returns:
+            tuple: Difficulty level names
+        """
+        return tuple(self.levels)
+    
+    @property
+    def levels(self):
+        """
+        Read-only mapping of level names to Difficulty, reloaded if the file changed.
+        
+        Raises:
+            OSError: If the file can't be read on first use
+            ValueError: If the file is not valid on first use
+        """
+        now = time.monotonic()
+        if self._levels is None:
+            mtime = os.stat(self.path).st_mtime_ns
+            self._levels = self._load()
+            self._mtime = mtime
+            self._checked_at = now
+        elif now - self._checked_at >= self.check_interval:
+            self._checked_at = now
+            self._reload_if_changed()
+        return self._levels
+    
+    def _reload_if_changed(self):
+        """Reload the file if its modification time changed, keeping the old levels on error."""
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+            if mtime == self._mtime:
+                return
+            self._mtime = mtime
+            self._levels = self._load()
+            logger.info(f"Difficulty levels reloaded from {self.path}")
+        except (OSError, ValueError) as error:
+            logger.error(f"Keeping previous difficulty levels: {error}")
+    
+    def _load(self):
+        """
+        Parse and validate the difficulty file.
+        
+        Returns:
+            MappingProxyType: Level names mapped to Difficulty
+        
+        Raises:
+            ValueError: If the file is not valid
+        """
+        with open(self.path, encoding='utf-8') as config_file:
+            data = json.load(config_file)
+        
+        if not isinstance(data, dict) or not data:
+            raise ValueError(f"{self.path} must contain a non-empty object")
+        
+        levels = {}
+        for name, values in data.items():
+            if not name or name == 'custom':
+                raise ValueError(f"Invalid difficulty level name: {name!r}")
+            try:
+                level = Difficulty(**values)
+            except TypeError:
+                raise ValueError(f"Difficulty {name!r} needs exactly "
+                                 f"{', '.join(Difficulty._fields)}") from None
+            if not all(type(value) is int for value in level):
+                raise ValueError(f"Difficulty {name!r} settings must be integers")
+            if level.min_number >= level.max_number:
+                raise ValueError(f"Difficulty {name!r} maximum number must be greater than minimum number")
+            if level.max_attempts <= 0:
+                raise ValueError(f"Difficulty {name!r} maximum attempts must be greater than 0")
+            levels[name] = level
+        
+        return MappingProxyType(levels)
+
+difficulties = DifficultyRegistry()
+
 class DifficultySettings:
     """Difficulty settings for the game."""
     
@@ -17,13 +157,11 @@ class DifficultySettings:
         
         Args:
             difficulty (str): Difficulty level ('easy', 'medium', 'hard')
-            
+        
         Returns:
             tuple: (min_number, max_number, max_attempts)
+        
+        Raises:
+            ValueError: If the difficulty level is unknown
         """
-        if difficulty == 'easy':
-            return 1, 50, 10
-        elif difficulty == 'hard':
-            return 1, 200, 5
-        else:  # medium (default)
-            return 1, 100, 7
+        return difficulties.get(difficulty)
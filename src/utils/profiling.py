@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Profiling Module
+
+This module contains profilers that can be switched on from the command
+line and controlled on a running process with signals:
+
+- SIGUSR1 writes the current reports without stopping collection.
+- SIGUSR2 pauses or resumes collection.
+"""
+
+import abc
+import cProfile
+import collections
+import logging
+import signal
+import sys
+import threading
+import tracemalloc
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+class Profiler(abc.ABC):
+    """Base class for profilers controlled by signals."""
+    
+    def __init__(self):
+        """Initialize the profiler."""
+        self.running = False
+    
+    def start(self):
+        """Start collecting data."""
+        self.running = True
+    
+    def stop(self):
+        """Stop collecting data."""
+        self.running = False
+    
+    def toggle(self):
+        """Pause collection if running, resume it otherwise."""
+        if self.running:
+            self.stop()
+        else:
+            self.start()
+        logger.info(f"{type(self).__name__} {'resumed' if self.running else 'paused'}")
+    
+    @abc.abstractmethod
+    def report(self):
+        """Write the current report."""
+    
+    def game_finished(self, record):
+        """
+        Handle the end of a game.
+        
+        Args:
+            record (GameRecord): The finished game
+        """
+
+class DeterministicProfiler(Profiler):
+    """Profiles every function call with cProfile."""
+    
+    def __init__(self, output_path):
+        """
+        Initialize the profiler.
+        
+        Args:
+            output_path (str): File the pstats data is written to, readable
+                with pstats or snakeviz
+        """
+        super().__init__()
+        self.output_path = output_path
+        self.profile = cProfile.Profile()
+    
+    def start(self):
+        """Start collecting data."""
+        self.profile.enable()
+        super().start()
+    
+    def stop(self):
+        """Stop collecting data."""
+        self.profile.disable()
+        super().stop()
+    
+    def report(self):
+        """Write the collected stats to the output file."""
+        # dump_stats disables the profiler, so resume it afterwards
+        was_running = self.running
+        self.profile.dump_stats(self.output_path)
+        if was_running:
+            self.profile.enable()
+        logger.info(f"Profile written to {self.output_path}")
+
+class SamplingProfiler(Profiler):
+    """Samples the main thread's stack at a fixed interval."""
+    
+    def __init__(self, output_path, interval=0.01):
+        """
+        Initialize the profiler.
+        
+        Args:
+            output_path (str): File the collapsed stacks are written to, in the
+                folded format read by flamegraph.pl and speedscope
+            interval (float): Seconds between samples, which bounds the overhead
+        """
+        super().__init__()
+        self.output_path = output_path
+        self.interval = interval
+        self.samples = collections.Counter()
+        # Reentrant so a report from a signal handler can't deadlock a report in progress
+        self._lock = threading.RLock()
+        self._thread_id = threading.main_thread().ident
+        self._stopped = threading.Event()
+        self._thread = None
+    
+    def start(self):
+        """Start the sampling thread."""
+        if self.running:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._sample, name="sampling-profiler",
+                                        daemon=True)
+        self._thread.start()
+        super().start()
+    
+    def stop(self):
+        """Stop the sampling thread."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        super().stop()
+    
+    def report(self):
+        """Write the collapsed stacks to the output file."""
+        with self._lock:
+            samples = self.samples.copy()
+        with open(self.output_path, 'w', encoding='utf-8') as output:
+            for stack, count in samples.most_common():
+                output.write(f"{stack} {count}\n")
+        logger.info(f"{sum(samples.values())} samples written to {self.output_path}")
+    
+    def _sample(self):
+        """Collect samples until stopped."""
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                folded = ';'.join(reversed(stack))
+                with self._lock:
+                    self.samples[folded] += 1
+
+class MemoryTracker(Profiler):
+    """Compares tracemalloc snapshots taken every N games to spot leaks."""
+    
+    def __init__(self, every_games=10, frames=1, limit=10):
+        """
+        Initialize the tracker.
+        
+        Args:
+            every_games (int): Number of games between snapshots
+            frames (int): Number of frames stored per allocation traceback
+            limit (int): Number of allocation sites listed per report
+        """
+        super().__init__()
+        self.every_games = every_games
+        self.frames = frames
+        self.limit = limit
+        self.games = 0
+        self._snapshot = None
+    
+    def start(self):
+        """Start tracing allocations."""
+        tracemalloc.start(self.frames)
+        self._snapshot = self._take_snapshot()
+        super().start()
+    
+    def stop(self):
+        """Stop tracing allocations."""
+        tracemalloc.stop()
+        self._snapshot = None
+        super().stop()
+    
+    def game_finished(self, record):
+        """
+        Count a finished game and report every N games.
+        
+        Args:
+            record (GameRecord): The finished game
+        """
+        self.games += 1
+        if self.running and self.games % self.every_games == 0:
+            self.report()
+    
+    def report(self):
+        """Log the allocation sites that grew the most since the last report."""
+        if not self.running:
+            return
+        snapshot = self._take_snapshot()
+        stats = snapshot.compare_to(self._snapshot, 'lineno')
+        self._snapshot = snapshot
+        logger.info(f"Memory growth after {self.games} games:")
+        for stat in stats[:self.limit]:
+            logger.info(str(stat))
+    
+    def _take_snapshot(self):
+        """Take a snapshot without tracemalloc's and the import system's own allocations."""
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+
+def install_signal_handlers(profilers):
+    """
+    Control profilers with SIGUSR1 (report) and SIGUSR2 (pause/resume).
+    
+    Signals are not available on Windows, where this does nothing.
+    
+    Args:
+        profilers (list): Profilers to control
+    """
+    if not hasattr(signal, 'SIGUSR1'):
+        logger.warning("Signals not supported on this platform")
+        return
+    
+    def report(signum, frame):
+        for profiler in profilers:
+            profiler.report()
+    
+    def toggle(signum, frame):
+        for profiler in profilers:
+            profiler.toggle()
+    
+    signal.signal(signal.SIGUSR1, report)
+    signal.signal(signal.SIGUSR2, toggle)
+    logger.info("Profiling signal handlers installed")
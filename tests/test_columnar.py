@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Test module for columnar export functionality.
+
+This module contains tests for the ColumnarExporter and ColumnarReader classes.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from src.analytics import columnar
+from src.analytics.columnar import ColumnarExporter, ColumnarReader
+from src.game.game_controller import (
+    OUTCOME_OUT_OF_ATTEMPTS, OUTCOME_QUIT, OUTCOME_WON, GameRecord
+)
+
+GAMES = [
+    GameRecord('easy', 1, 50, 25, 3, OUTCOME_WON, (10, 30, 25)),
+    GameRecord('medium', 1, 100, 42, 7, OUTCOME_OUT_OF_ATTEMPTS, (50, 25, 37, 43, 40, 41, 39)),
+    GameRecord('hard', 1, 200, 100, 1, OUTCOME_WON, (100,)),
+    GameRecord('custom', 1, 10 ** 18, 5, 0, OUTCOME_QUIT, ()),
+]
+
+@unittest.skipIf(columnar.np is None, "numpy is not installed")
+class TestColumnarExport(unittest.TestCase):
+    """Test cases for the columnar export."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.directory = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        """Remove the exported files."""
+        shutil.rmtree(self.directory)
+    
+    def export(self, file_format, games=GAMES, chunk_size=3):
+        """Export games and return a reader for them."""
+        exporter = ColumnarExporter(self.directory, chunk_size=chunk_size, file_format=file_format)
+        for game in games:
+            exporter.add(game)
+        exporter.close()
+        return ColumnarReader(self.directory)
+    
+    def check_round_trip(self, reader):
+        """Check that every exported game can be read back."""
+        games = []
+        for chunk in reader.chunks():
+            offsets = chunk['guess_offsets']
+            for i in range(len(chunk['outcome'])):
+                guesses = tuple(int(guess) for guess in chunk['guess_values'][offsets[i]:offsets[i + 1]])
+                games.append(GameRecord(
+                    str(chunk['difficulty'][i]), int(chunk['min_number'][i]),
+                    int(chunk['max_number'][i]), int(chunk['secret_number'][i]),
+                    int(chunk['attempts'][i]), int(chunk['outcome'][i]), guesses))
+        self.assertEqual(games, GAMES)
+    
+    def test_npy_round_trip(self):
+        """Test writing and reading .npy chunks."""
+        reader = self.export('npy')
+        self.assertEqual(len(reader.chunk_paths()), 2)
+        self.check_round_trip(reader)
+    
+    @unittest.skipIf(columnar.pa is None, "pyarrow is not installed")
+    def test_arrow_round_trip(self):
+        """Test writing and reading Arrow chunks."""
+        reader = self.export('arrow')
+        self.assertTrue(all(path.endswith('.arrow') for path in reader.chunk_paths()))
+        self.check_round_trip(reader)
+    
+    @unittest.skipIf(columnar.pa is None, "pyarrow is not installed")
+    def test_formats_share_dtypes(self):
+        """Test that .npy and Arrow chunks give the same numeric dtypes."""
+        dtypes = {}
+        for file_format in ('npy', 'arrow'):
+            chunk = next(self.export(file_format, games=GAMES[:1]).chunks())
+            dtypes[file_format] = {name: column.dtype for name, column in chunk.items()
+                                   if name != 'difficulty'}
+            shutil.rmtree(self.directory)
+            self.directory = tempfile.mkdtemp()
+        self.assertEqual(dtypes['arrow'], dtypes['npy'])
+    
+    def test_failed_write_leaves_no_partial_chunk(self):
+        """Test that a chunk that fails to write is cleaned up."""
+        formats = ['npy'] + (['arrow'] if columnar.pa is not None else [])
+        for file_format in formats:
+            exporter = ColumnarExporter(self.directory, file_format=file_format)
+            exporter.add(GAMES[0])
+            with mock.patch('os.rename', side_effect=OSError("disk full")):
+                with self.assertRaises(OSError):
+                    exporter.close()
+            self.assertEqual(os.listdir(self.directory), [])
+    
+    def test_summary(self):
+        """Test aggregating over all chunks."""
+        summary = self.export('npy', chunk_size=1).summary()
+        self.assertEqual(summary['games'], 4)
+        self.assertEqual(summary['wins'], 2)
+        self.assertEqual(summary['quits'], 1)
+        self.assertEqual(summary['win_rate'], 50.0)
+        self.assertEqual(summary['average_attempts'], 11 / 4)
+        self.assertEqual(summary['attempts'], {1: 1, 3: 1})
+    
+    def test_append_to_existing_export(self):
+        """Test that a new exporter continues after existing chunks."""
+        self.export('npy', games=GAMES[:2])
+        reader = self.export('npy', games=GAMES[2:])
+        self.assertEqual(len(reader.chunk_paths()), 2)
+        self.check_round_trip(reader)
+    
+    def test_numbers_beyond_64_bits_skipped(self):
+        """Test that games that don't fit in 64 bits are skipped."""
+        huge = GameRecord('custom', 1, 10 ** 30, 10 ** 29, 1, OUTCOME_QUIT, (5,))
+        reader = self.export('npy', games=[huge] + GAMES)
+        self.check_round_trip(reader)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,11 +4,14 @@
 """
 Test module for configuration functionality.
 
-This module contains tests for the DifficultySettings class.
+This module contains tests for the DifficultySettings and DifficultyRegistry classes.
 """
 
+import json
+import os
+import tempfile
 import unittest
-from src.utils.config import DifficultySettings
+from src.utils.config import DifficultyRegistry, DifficultySettings
 
 class TestDifficultySettings(unittest.TestCase):
     """Test cases for the difficulty settings."""
@@ -33,6 +36,80 @@ class TestDifficultySettings(unittest.TestCase):
         self.assertEqual(min_num, 1)
         self.assertEqual(max_num, 200)
         self.assertEqual(max_attempts, 5)
+    
+    def test_unknown_difficulty(self):
+        """Test that unknown difficulty levels are rejected."""
+        with self.assertRaises(ValueError):
+            DifficultySettings.get_settings('impossible')
+
+class TestDifficultyRegistry(unittest.TestCase):
+    """Test cases for the difficulty registry."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        handle, self.path = tempfile.mkstemp(suffix='.json')
+        os.close(handle)
+        self.write_levels({'easy': {'min_number': 1, 'max_number': 10, 'max_attempts': 5}})
+    
+    def tearDown(self):
+        """Remove the difficulty file."""
+        os.remove(self.path)
+    
+    def write_levels(self, levels, mtime_offset=0):
+        """Write the difficulty file and move its modification time forward."""
+        with open(self.path, 'w', encoding='utf-8') as config_file:
+            json.dump(levels, config_file)
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + mtime_offset))
+    
+    def test_load(self):
+        """Test loading levels from a file."""
+        registry = DifficultyRegistry(self.path)
+        self.assertEqual(registry.names(), ('easy',))
+        self.assertEqual(tuple(registry.get('easy')), (1, 10, 5))
+        with self.assertRaises(TypeError):
+            registry.levels['easy'] = (1, 2, 3)
+    
+    def test_loaded_lazily(self):
+        """Test that a missing file is only reported when the levels are used."""
+        registry = DifficultyRegistry(self.path + '.missing')
+        with self.assertRaises(OSError):
+            registry.get('easy')
+    
+    def test_default(self):
+        """Test that the default level falls back to the first level."""
+        self.assertEqual(DifficultyRegistry(self.path).default(), 'easy')
+        
+        self.write_levels({
+            'easy': {'min_number': 1, 'max_number': 10, 'max_attempts': 5},
+            'medium': {'min_number': 1, 'max_number': 100, 'max_attempts': 7},
+        })
+        self.assertEqual(DifficultyRegistry(self.path).default(), 'medium')
+    
+    def test_invalid_levels(self):
+        """Test that invalid files are rejected."""
+        invalid = (
+            {},
+            {'custom': {'min_number': 1, 'max_number': 10, 'max_attempts': 5}},
+            {'easy': {'min_number': 1, 'max_number': 10}},
+            {'easy': {'min_number': 1, 'max_number': '10', 'max_attempts': 5}},
+            {'easy': {'min_number': 10, 'max_number': 1, 'max_attempts': 5}},
+            {'easy': {'min_number': 1, 'max_number': 10, 'max_attempts': 0}},
+        )
+        for levels in invalid:
+            self.write_levels(levels)
+            with self.assertRaises(ValueError):
+                DifficultyRegistry(self.path).names()
+    
+    def test_reload_on_change(self):
+        """Test that a changed file is reloaded and an invalid one is ignored."""
+        registry = DifficultyRegistry(self.path, check_interval=0)
+        
+        self.write_levels({'hard': {'min_number': 1, 'max_number': 500, 'max_attempts': 3}}, 10 ** 9)
+        self.assertEqual(registry.names(), ('hard',))
+        
+        self.write_levels({'hard': {'min_number': 1}}, 2 * 10 ** 9)
+        self.assertEqual(registry.names(), ('hard',))
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Test module for game controller functionality.
+
+This module contains tests for the GameController class.
+"""
+
+import unittest
+from unittest import mock
+from src.game.game_controller import (
+    OUTCOME_OUT_OF_ATTEMPTS, OUTCOME_QUIT, OUTCOME_WON, GameController, GameRecord
+)
+
+class TestGameController(unittest.TestCase):
+    """Test cases for the game controller."""
+    
+    def setUp(self):
+        """Set up a controller with a scripted user interface."""
+        self.controller = GameController()
+        self.controller.ui = mock.Mock()
+        self.controller.game_logic.initialize_game = mock.Mock()
+        self.controller.game_logic.secret_number = 42
+        self.records = []
+        self.controller.game_listeners.append(self.records.append)
+    
+    def play(self, guesses, max_attempts=3):
+        """Play one game with scripted guesses, None meaning quit."""
+        self.controller.ui.get_guess.side_effect = [(guess, guess is None) for guess in guesses]
+        return self.controller.play_game(1, 100, max_attempts, 'medium')
+    
+    def test_play_game_won(self):
+        """Test the record of a won game."""
+        self.assertTrue(self.play([50, 42]))
+        self.assertEqual(self.records, [GameRecord('medium', 1, 100, 42, 2, OUTCOME_WON, (50, 42))])
+    
+    def test_play_game_out_of_attempts(self):
+        """Test the record of a game that used all attempts, ignoring repeated guesses."""
+        self.assertFalse(self.play([50, 50, 30, 45]))
+        self.assertEqual(self.records, [
+            GameRecord('medium', 1, 100, 42, 3, OUTCOME_OUT_OF_ATTEMPTS, (50, 30, 45))
+        ])
+    
+    def test_play_game_quit(self):
+        """Test the record of a game the player quit."""
+        self.assertFalse(self.play([60, None]))
+        self.assertEqual(self.records, [GameRecord('medium', 1, 100, 42, 1, OUTCOME_QUIT, (60,))])
+    
+    def test_removed_difficulty_keeps_previous_settings(self):
+        """Test that removing the active level between games doesn't end the session."""
+        self.controller.ui.ask_play_again.side_effect = [True, False]
+        settings = [(1, 50, 10), ValueError("Unknown difficulty level: 'easy'")]
+        
+        with mock.patch('src.utils.config.DifficultySettings.get_settings', side_effect=settings), \
+                mock.patch.object(self.controller, 'play_game', return_value=True) as play_game:
+            self.assertEqual(self.controller.run('easy'), 0)
+        
+        self.assertEqual(play_game.call_args_list, [mock.call(1, 50, 10, 'easy'), mock.call(1, 50, 10, 'easy')])
+
+if __name__ == '__main__':
+    unittest.main()
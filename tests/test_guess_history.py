@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Test module for guess history functionality.
+
+This module contains tests for the GuessHistory class.
+"""
+
+import unittest
+from src.game.guess_history import GuessHistory
+
+class TestGuessHistory(unittest.TestCase):
+    """Test cases for the guess history."""
+    
+    def test_initial_interval(self):
+        """Test that a new history covers the whole range."""
+        history = GuessHistory(1, 100)
+        self.assertEqual((history.low, history.high), (1, 100))
+        self.assertFalse(history.is_guessed(50))
+        self.assertFalse(history.is_excluded(1))
+        self.assertFalse(history.is_excluded(100))
+    
+    def test_record_narrows_interval(self):
+        """Test that feedback narrows the feasible interval."""
+        history = GuessHistory(1, 100)
+        history.record(50, -1)
+        history.record(75, 1)
+        
+        self.assertEqual((history.low, history.high), (51, 74))
+        self.assertTrue(history.is_excluded(50))
+        self.assertTrue(history.is_excluded(30))
+        self.assertTrue(history.is_excluded(75))
+        self.assertFalse(history.is_excluded(60))
+        self.assertEqual(history.guesses, [50, 75])
+    
+    def test_is_guessed(self):
+        """Test detecting repeated guesses."""
+        history = GuessHistory(1, 100)
+        history.record(1, -1)
+        history.record(100, 1)
+        
+        self.assertTrue(history.is_guessed(1))
+        self.assertTrue(history.is_guessed(100))
+        self.assertFalse(history.is_guessed(2))
+        self.assertFalse(history.is_guessed(0))
+        self.assertFalse(history.is_guessed(101))
+    
+    def test_huge_range(self):
+        """Test tracking guesses in a huge range."""
+        history = GuessHistory(1, 10 ** 18)
+        
+        history.record(10 ** 17, 1)
+        self.assertTrue(history.is_guessed(10 ** 17))
+        self.assertFalse(history.is_guessed(10 ** 17 - 1))
+        self.assertEqual(history.high, 10 ** 17 - 1)
+        self.assertTrue(history.is_excluded(10 ** 18))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Test module for log analytics functionality.
+
+This module contains tests for reconstructing games from log files.
+"""
+
+import gzip
+import os
+import shutil
+import tempfile
+import unittest
+from src.analytics.log_analytics import analyze_logs, group_rotated, parse_events
+
+FIRST_GAME = """\
+2026-01-01 10:00:00,000 - src.game.game_logic - INFO - New game initialized with range 1-100
+2026-01-01 10:00:00,001 - src.game.game_controller - INFO - Game initialized with secret number: 42
+2026-01-01 10:00:02,000 - src.game.game_ui - WARNING - Invalid input received
+2026-01-01 10:00:04,000 - src.game.game_ui - INFO - Player guessed 50
+2026-01-01 10:00:05,000 - src.game.game_ui - INFO - Player guessed 50
+2026-01-01 10:00:05,001 - src.game.game_ui - INFO - Repeated guess 50 ignored
+2026-01-01 10:00:06,000 - src.game.game_ui - INFO - Player guessed 42
+2026-01-01 10:00:06,001 - src.game.game_ui - INFO - Player won in 2 attempts
+2026-01-01 10:00:06,002 - src.game.game_controller - INFO - Player won. Total wins: 1
+"""
+
+SECOND_GAME = """\
+2026-01-01 10:01:00,000 - src.game.game_logic - INFO - New game initialized with range 1-50
+2026-01-01 10:01:03,000 - src.game.game_ui - INFO - Player guessed 10
+2026-01-01 10:01:04,000 - src.game.game_ui - INFO - Player chose to quit
+2026-01-01 10:01:04,001 - src.game.game_controller - INFO - Player lost. Total losses: 1
+2026-01-01 10:02:00,000 - src.game.game_logic - INFO - New game initialized with range 1-50
+"""
+
+class TestLogAnalytics(unittest.TestCase):
+    """Test cases for the log analytics."""
+    
+    def setUp(self):
+        """Write a rotated log with a compressed older file."""
+        self.directory = tempfile.mkdtemp()
+        self.current = os.path.join(self.directory, 'game.log')
+        self.rotated = os.path.join(self.directory, 'game.log.1.gz')
+        with gzip.open(self.rotated, 'wt', encoding='utf-8') as log_file:
+            log_file.write(FIRST_GAME)
+        with open(self.current, 'w', encoding='utf-8') as log_file:
+            log_file.write(SECOND_GAME)
+    
+    def tearDown(self):
+        """Remove the log files."""
+        shutil.rmtree(self.directory)
+    
+    def test_parse_events(self):
+        """Test that only game events are parsed."""
+        kinds = [kind for kind, timestamp, attempts in parse_events(FIRST_GAME.splitlines())]
+        self.assertEqual(kinds, ['start', 'invalid', 'guess', 'guess', 'ignored', 'guess', 'won'])
+    
+    def test_group_rotated(self):
+        """Test that rotated files are grouped oldest first."""
+        other = os.path.join(self.directory, 'other.log')
+        groups = group_rotated([self.current, other, self.rotated])
+        self.assertEqual(groups, [[self.rotated, self.current], [other]])
+    
+    def test_analyze_logs(self):
+        """Test statistics over a rotated log."""
+        stats = analyze_logs([self.current, self.rotated])
+        
+        self.assertEqual(stats.games, 3)
+        self.assertEqual((stats.wins, stats.losses, stats.quits, stats.incomplete), (1, 1, 1, 1))
+        self.assertEqual(stats.win_rate, 50.0)
+        self.assertEqual(stats.guesses, 3)
+        self.assertEqual(stats.ignored_guesses, 1)
+        self.assertEqual(stats.invalid_input_rate, 20.0)
+        self.assertEqual(dict(stats.attempts), {2: 1})
+        # 4s and 2s (including the ignored guess) in the first game, 3s in the second
+        self.assertEqual(stats.timed_guesses, stats.guesses)
+        self.assertAlmostEqual(stats.average_guess_time, 9 / 3)
+    
+    def test_unreadable_logs(self):
+        """Test that missing and corrupt files raise OSError."""
+        corrupt = os.path.join(self.directory, 'corrupt.log.gz')
+        with open(corrupt, 'w', encoding='utf-8') as log_file:
+            log_file.write(SECOND_GAME)
+        
+        for path in (os.path.join(self.directory, 'missing.log'), corrupt):
+            with self.assertRaises(OSError):
+                analyze_logs([path])
+    
+    def test_analyze_logs_with_workers(self):
+        """Test that a process pool gives the same statistics."""
+        other = os.path.join(self.directory, 'other.log')
+        shutil.copy(self.current, other)
+        
+        sequential = analyze_logs([self.current, self.rotated, other])
+        parallel = analyze_logs([self.current, self.rotated, other], workers=2)
+        self.assertEqual(vars(parallel), vars(sequential))
+
+if __name__ == '__main__':
+    unittest.main()
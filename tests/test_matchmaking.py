@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Test module for matchmaking functionality.
+
+This module contains tests for the MatchmakingQueue class.
+"""
+
+import os
+import random
+import time
+import unittest
+from src.game.matchmaking import (
+    DEFAULT_RATING, MatchmakingQueue, expected_score, rating_from_results
+)
+
+class TestRatings(unittest.TestCase):
+    """Test cases for the rating helpers."""
+    
+    def test_expected_score(self):
+        """Test expected scores for equal and unequal ratings."""
+        self.assertAlmostEqual(expected_score(1500, 1500), 0.5)
+        self.assertGreater(expected_score(1700, 1500), 0.5)
+        self.assertAlmostEqual(expected_score(1700, 1500) + expected_score(1500, 1700), 1.0)
+    
+    def test_rating_from_results(self):
+        """Test deriving a rating from play_game results."""
+        self.assertEqual(rating_from_results([]), DEFAULT_RATING)
+        self.assertGreater(rating_from_results([True, True, False]), DEFAULT_RATING)
+        self.assertLess(rating_from_results([False, False, True]), DEFAULT_RATING)
+
+class TestMatchmakingQueue(unittest.TestCase):
+    """Test cases for the matchmaking queue."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.queue = MatchmakingQueue(base_window=50, window_growth=10, max_window=200)
+    
+    def test_pairs_nearest_ratings(self):
+        """Test that players are paired with their nearest rated neighbour."""
+        for player_id, rating in (('a', 1500), ('b', 1900), ('c', 1520), ('d', 1880)):
+            self.queue.enqueue(player_id, 0, rating=rating)
+        
+        pairs = self.queue.tick(0)
+        self.assertEqual(sorted(map(sorted, pairs)), [['a', 'c'], ['b', 'd']])
+        self.assertEqual(len(self.queue), 0)
+    
+    def test_window_widens_over_time(self):
+        """Test that distant players are paired after waiting."""
+        self.queue.enqueue('a', 0, rating=1500)
+        self.queue.enqueue('b', 0, rating=1600)
+        
+        self.assertEqual(self.queue.tick(0), [])
+        self.assertIsNone(self.queue.find_opponent('a', 0))
+        self.assertEqual(self.queue.find_opponent('a', 5), 'b')
+        self.assertEqual(self.queue.tick(5), [('a', 'b')])
+    
+    def test_dequeue(self):
+        """Test removing a player from the queue."""
+        self.queue.enqueue('a', 0)
+        self.queue.enqueue('b', 0)
+        
+        self.assertTrue(self.queue.dequeue('a'))
+        self.assertFalse(self.queue.dequeue('a'))
+        self.assertNotIn('a', self.queue)
+        self.assertEqual(self.queue.tick(100), [])
+    
+    def test_enqueue_twice(self):
+        """Test that a player cannot be queued twice."""
+        self.queue.enqueue('a', 0)
+        with self.assertRaises(ValueError):
+            self.queue.enqueue('a', 1)
+    
+    def test_results_applied_per_tick(self):
+        """Test that rating updates wait for the next tick."""
+        self.queue.report_result('a', 'b', 1)
+        self.queue.report_result('a', 'b', 1)
+        self.assertEqual(self.queue.get_rating('a'), DEFAULT_RATING)
+        
+        self.queue.tick(0)
+        # Both results are scored against the ratings at the start of the tick
+        self.assertAlmostEqual(self.queue.get_rating('a'), DEFAULT_RATING + 32)
+        self.assertAlmostEqual(self.queue.get_rating('b'), DEFAULT_RATING - 32)
+    
+    def test_results_reorder_queued_players(self):
+        """Test that queued players are paired using their updated ratings."""
+        queue = MatchmakingQueue(base_window=1000, k_factor=400)
+        for player_id, rating in (('a', 1500), ('b', 1530), ('c', 1560), ('d', 1590)):
+            queue.enqueue(player_id, 0, rating=rating)
+        # d drops below b and a climbs above c
+        queue.report_result('a', 'd', 1)
+        
+        pairs = queue.tick(0)
+        self.assertEqual(sorted(map(sorted, pairs)), [['a', 'c'], ['b', 'd']])
+
+@unittest.skipUnless(os.environ.get('RUN_BENCHMARKS'), "Set RUN_BENCHMARKS=1 to run benchmarks")
+class TestMatchmakingBenchmark(unittest.TestCase):
+    """Benchmarks for the matchmaking queue."""
+    
+    PLAYERS = 100000
+    
+    def setUp(self):
+        """Queue PLAYERS players with random ratings."""
+        rng = random.Random(0)
+        self.ratings = [rng.gauss(DEFAULT_RATING, 200) for _ in range(self.PLAYERS)]
+        self.queue = MatchmakingQueue()
+    
+    def test_pairs_100k_players_per_second(self):
+        """Test queueing and pairing 100k players within one second."""
+        start = time.perf_counter()
+        for player_id, rating in enumerate(self.ratings):
+            self.queue.enqueue(player_id, 0, rating=rating)
+        pairs = self.queue.tick(60)
+        elapsed = time.perf_counter() - start
+        
+        print(f"\n{self.PLAYERS} players queued and paired in {elapsed:.3f}s")
+        self.assertEqual(len(pairs), self.PLAYERS // 2)
+        self.assertLess(elapsed, 1.0)
+    
+    def test_batched_rating_updates(self):
+        """Test applying 4000 results with 100k players queued within one second."""
+        for player_id, rating in enumerate(self.ratings):
+            self.queue.enqueue(player_id, 0, rating=rating)
+        for player_id in range(0, 8000, 2):
+            self.queue.report_result(player_id, player_id + 1, 1)
+        
+        start = time.perf_counter()
+        self.queue.tick(0)
+        elapsed = time.perf_counter() - start
+        
+        print(f"\n4000 results applied with {self.PLAYERS} players queued in {elapsed:.3f}s")
+        self.assertLess(elapsed, 1.0)
+
+if __name__ == '__main__':
+    unittest.main()
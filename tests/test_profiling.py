@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Test module for profiling functionality.
+
+This module contains tests for the profilers and their signal handlers.
+"""
+
+import os
+import pstats
+import signal
+import tempfile
+import time
+import unittest
+from src.game.game_controller import OUTCOME_WON, GameRecord
+from src.utils.profiling import (
+    DeterministicProfiler, MemoryTracker, Profiler, SamplingProfiler, install_signal_handlers
+)
+
+def busy_loop(seconds):
+    """Keep the main thread busy for a while."""
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(range(100))
+
+class TestProfiling(unittest.TestCase):
+    """Test cases for the profilers."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        handle, self.output_path = tempfile.mkstemp(suffix='.prof')
+        os.close(handle)
+    
+    def tearDown(self):
+        """Remove the output file."""
+        os.remove(self.output_path)
+    
+    def test_deterministic_profiler(self):
+        """Test that the profile can be read by pstats while still running."""
+        profiler = DeterministicProfiler(self.output_path)
+        profiler.start()
+        sorted(range(100))
+        profiler.report()
+        
+        self.assertTrue(profiler.running)
+        profiler.stop()
+        self.assertGreater(pstats.Stats(self.output_path).total_calls, 0)
+    
+    def test_sampling_profiler(self):
+        """Test that sampling pauses on toggle and writes folded stacks."""
+        profiler = SamplingProfiler(self.output_path, interval=0.001)
+        profiler.start()
+        busy_loop(0.2)
+        profiler.toggle()
+        
+        self.assertFalse(profiler.running)
+        collected = sum(profiler.samples.values())
+        self.assertGreater(collected, 0)
+        busy_loop(0.05)
+        self.assertEqual(sum(profiler.samples.values()), collected)
+        
+        profiler.report()
+        with open(self.output_path, encoding='utf-8') as output:
+            lines = output.read().splitlines()
+        stacks = [line.rsplit(' ', 1) for line in lines]
+        self.assertEqual(sum(int(count) for stack, count in stacks), collected)
+        self.assertTrue(any(stack.split(';')[-1].startswith('busy_loop ') for stack, count in stacks))
+    
+    def test_report_required(self):
+        """Test that profilers must implement report."""
+        class Incomplete(Profiler):
+            pass
+        
+        with self.assertRaises(TypeError):
+            Incomplete()
+    
+    def test_memory_tracker_reports_every_n_games(self):
+        """Test that memory growth is reported every N games."""
+        tracker = MemoryTracker(every_games=2)
+        tracker.start()
+        try:
+            with self.assertLogs('src.utils.profiling', level='INFO') as logs:
+                for _ in range(4):
+                    tracker.game_finished(GameRecord('easy', 1, 50, 25, 3, OUTCOME_WON, (10, 30, 25)))
+        finally:
+            tracker.stop()
+        
+        headers = [line for line in logs.output if 'Memory growth' in line]
+        self.assertEqual(len(headers), 2)
+    
+    @unittest.skipUnless(hasattr(signal, 'SIGUSR1'), "Signals not supported")
+    def test_signal_handlers(self):
+        """Test reporting and pausing with signals."""
+        profiler = DeterministicProfiler(self.output_path)
+        previous = (signal.getsignal(signal.SIGUSR1), signal.getsignal(signal.SIGUSR2))
+        install_signal_handlers([profiler])
+        try:
+            profiler.start()
+            os.kill(os.getpid(), signal.SIGUSR2)
+            self.assertFalse(profiler.running)
+            
+            os.kill(os.getpid(), signal.SIGUSR1)
+            self.assertGreater(os.path.getsize(self.output_path), 0)
+        finally:
+            signal.signal(signal.SIGUSR1, previous[0])
+            signal.signal(signal.SIGUSR2, previous[1])
+
+if __name__ == '__main__':
+    unittest.main()